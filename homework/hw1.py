@@ -1,9 +1,49 @@
+import heapq
+from collections import OrderedDict
+import numpy as np
+
 h = 0.00001
 
-def df(f, x):
-    return (f(x+h)-f(x))/h 
+# Finite difference stencils: offsets (in units of step) and weights (in
+# units of 1/step). 'richardson' is (4*D(step/2) - D(step))/3 for the
+# central difference D, accurate to O(step**4).
+STENCILS = {
+    'forward': ([0, 1], [-1, 1]),
+    'central': ([-1, 1], [-1/2, 1/2]),
+    'richardson': ([-1, -1/2, 1/2, 1], [1/6, -4/3, 4/3, -1/6]),
+}
+STEPS = {'forward': h, 'central': h, 'richardson': 1e-3, 'complex': 1e-20}
+
+def df(f, x, method='forward', step=None):
+    if method == 'forward' and step is None:
+        return (f(x+h)-f(x))/h 
+    step = STEPS[method] if step is None else step
+    if method == 'complex':
+        # f must accept complex input; one evaluation, no cancellation.
+        return f(x+1j*step).imag/step
+    if method not in STENCILS:
+        raise ValueError(f"Unknown differentiation method: {method}")
+    offsets, weights = STENCILS[method]
+    return sum(w*f(x+o*step) for o, w in zip(offsets, weights))/step
 
-def integral(f, a, b):
+def integral(f, a, b, method='riemann', atol=1e-10, rtol=1e-10, full_output=False, limit=200):
+    if method == 'adaptive':
+        # full_output returns (area, error, evaluations, converged);
+        # otherwise missing the tolerance within limit panels is an error.
+        area, err, neval, converged = quad(f, a, b, atol, rtol, limit)
+        if full_output:
+            return area, err, neval, converged
+        if not converged:
+            raise RuntimeError(f"Adaptive integration did not reach the tolerance with {limit} panels "
+                               f"(error estimate {err:.3g})")
+        return area
+    if method == 'cumulative':
+        # Signed like 'adaptive': for b < a use the table that starts at b.
+        if b < a:
+            return -cumulative(f, b)(a)
+        return cumulative(f, a)(b)
+    if method != 'riemann':
+        raise ValueError(f"Unknown integration method: {method}")
     x = a
     area = 0
     while x<b:
@@ -11,16 +51,179 @@ def integral(f, a, b):
         x+=h
     return area
 
-def theorem1(f, x):
-    r = df(lambda x:integral(f, 0, x), x)
+# Gauss-Kronrod 7-15 rule on [-1, 1]: the 15 Kronrod nodes contain the 7
+# Gauss nodes, so every panel gives an estimate and an error bound from
+# the same 15 evaluations of f.
+XGK = [0.991455371120812639206854697526329, 0.949107912342758524526189684047851,
+       0.864864423359769072789712788640926, 0.741531185599394439863864773280788,
+       0.586087235467691130294144845693013, 0.405845151377397166906606412076961,
+       0.207784955007898467600689403773245, 0.000000000000000000000000000000000]
+WGK = [0.022935322010529224963732008058970, 0.063092092629978553290700663189204,
+       0.104790010322250183839876322541518, 0.140653259715525918745189590510238,
+       0.169004726639267902826583426598550, 0.190350578064785409913256402421014,
+       0.204432940075298892414161999234649, 0.209482141084727828012999174891714]
+WG = [0.129484966168869693270611432679082, 0.279705391489276667901467771423780,
+      0.381830050505118944950369775488975, 0.417959183673469387755102040816327]
+
+def gk15(f, a, b):
+    c = (a+b)/2
+    r = (b-a)/2
+    fc = f(c)
+    kronrod = WGK[7]*fc
+    gauss = WG[3]*fc
+    for i in range(7):
+        s = f(c-r*XGK[i]) + f(c+r*XGK[i])
+        kronrod += WGK[i]*s
+        if i % 2 == 1:
+            gauss += WG[i//2]*s
+    return kronrod*r, abs((kronrod-gauss)*r)
+
+def quad(f, a, b, atol=1e-10, rtol=1e-10, limit=200):
+    # Globally adaptive: always bisect the panel with the largest error
+    # until the total error meets max(atol, rtol*|area|).
+    # Returns (area, error estimate, number of evaluations of f, converged),
+    # where converged is False if limit panels were used up first.
+    area, err = gk15(f, a, b)
+    neval = 15
+    heap = [(-err, a, b, area)]
+    while err > max(atol, rtol*abs(area)) and len(heap) < limit:
+        e, lo, hi, s = heapq.heappop(heap)
+        mid = (lo+hi)/2
+        s1, e1 = gk15(f, lo, mid)
+        s2, e2 = gk15(f, mid, hi)
+        neval += 30
+        area += s1+s2-s
+        err += e1+e2+e
+        heapq.heappush(heap, (-e1, lo, mid, s1))
+        heapq.heappush(heap, (-e2, mid, hi, s2))
+    return area, err, neval, err <= max(atol, rtol*abs(area))
+
+# Array versions: f must accept a NumPy array (ufuncs, +, *, ** ...),
+# so the whole grid is evaluated in one call instead of a Python loop.
+
+def df_array(f, x, method='forward', step=None):
+    x = np.asarray(x, dtype=float)
+    step = STEPS[method] if step is None else step
+    if method == 'complex':
+        return f(x+1j*step).imag/step
+    if method not in STENCILS:
+        raise ValueError(f"Unknown differentiation method: {method}")
+    offsets, weights = STENCILS[method]
+    # All stencil points in one call to f; points shared by neighbouring
+    # x (e.g. a grid with spacing step) are evaluated only once.
+    points = x[..., None] + step*np.array(offsets)
+    unique, index = np.unique(points, return_inverse=True)
+    values = np.asarray(f(unique))[index].reshape(points.shape)
+    return values @ np.array(weights)/step
+
+def integral_array(f, a, b):
+    # Same left Riemann sum as integral(), b may be a scalar or an array of
+    # upper limits; all of them share one sampling of f on [a, max(b)).
+    b = np.asarray(b, dtype=float)
+    n = np.maximum(np.ceil((b-a)/h), 0).astype(int)
+    x = a + h*np.arange(n.max(initial=0))
+    area = np.concatenate(([0.0], np.cumsum(f(x))*h))
+    return area[n]
+
+class CumulativeIntegral:
+    # F(x) = integral of f from a to x, kept as a prefix sum of trapezoids
+    # on the grid a, a+step, a+2*step, ...  f is sampled with NumPy arrays
+    # and only on the part of the grid that has not been seen yet. The
+    # tables grow geometrically, so extending a little at a time stays
+    # linear overall; grid point k is a + k*step and is not stored.
+    def __init__(self, f, a, step=h, chunk=1024):
+        self.f = f
+        self.a = a
+        self.step = step
+        self.chunk = chunk
+        self.n = 1
+        self.y = np.empty(chunk+1)
+        self.F = np.empty(chunk+1)
+        self.y[0] = np.asarray(f(np.array([a], dtype=float)), dtype=float).reshape(-1)[0]
+        self.F[0] = 0.0
+        # __call__ interpolates between grid points k and k+1, so build
+        # the first chunk now: the table never has fewer than two points.
+        self.extend(a + step)
+
+    @property
+    def nbytes(self):
+        return self.y.nbytes + self.F.nbytes
+
+    def extend(self, b):
+        m = self.n
+        n = int(np.ceil((b-self.a)/self.step)) + 1
+        if n <= m:
+            return
+        n = max(n, m+self.chunk)
+        if n > len(self.y):
+            capacity = max(n, 2*len(self.y))
+            self.y = np.resize(self.y, capacity)
+            self.F = np.resize(self.F, capacity)
+        x = self.a + self.step*np.arange(m, n)
+        y = np.asarray(self.f(x), dtype=float)
+        trap = (np.concatenate((self.y[m-1:m], y[:-1])) + y)*self.step/2
+        self.y[m:n] = y
+        self.F[m:n] = self.F[m-1] + np.cumsum(trap)
+        self.n = n
+
+    def __call__(self, b):
+        b = np.asarray(b, dtype=float)
+        if np.any(b < self.a):
+            raise ValueError("Upper limit must not be below the lower limit")
+        self.extend(b.max(initial=self.a))
+        k = np.minimum(((b-self.a)/self.step).astype(int), self.n-2)
+        d = b - (self.a + self.step*k)
+        # f is taken as linear inside a grid cell, so F is quadratic there
+        # and its derivative is continuous across cells.
+        slope = (self.y[k+1]-self.y[k])/self.step
+        area = self.F[k] + d*(self.y[k] + slope*d/2)
+        return area if area.ndim else float(area)
+
+CUMULATIVE_CACHE_BYTES = 64 * 2**20
+_cumulative_cache = OrderedDict()
+
+def cumulative(f, a):
+    # Shared CumulativeIntegral for (f, a), so repeated integral(f, a, x)
+    # calls only integrate the part beyond the largest x seen so far.
+    # Least recently used tables are dropped once all of them together
+    # exceed CUMULATIVE_CACHE_BYTES; the one returned is always kept.
+    key = (f, a)
+    if key in _cumulative_cache:
+        _cumulative_cache.move_to_end(key)
+    else:
+        _cumulative_cache[key] = CumulativeIntegral(f, a)
+    size = sum(c.nbytes for c in _cumulative_cache.values())
+    while len(_cumulative_cache) > 1 and size > CUMULATIVE_CACHE_BYTES:
+        size -= _cumulative_cache.popitem(last=False)[1].nbytes
+    return _cumulative_cache[key]
+
+def theorem1(f, x, method='riemann'):
+    r = df(lambda x:integral(f, 0, x, method), x)
     print('r=', r, 'f(x)=', f(x))
     print('abs(r-f(x))<0.01 = ', abs(r-f(x))<0.01)
     assert abs(r-f(x))<0.01
 
+def theorem1_array(f, x):
+    # One cumulative table answers every x; returns the largest |F'(x)-f(x)|.
+    x = np.asarray(x, dtype=float)
+    F = cumulative(f, 0)
+    err = np.abs(df_array(F, x) - f(x))
+    assert np.all(err<0.01)
+    return err.max()
+
 def f(x):
     return x**3
 
 if __name__ == '__main__':
     print('df(f, 2)=', df(f, 2))
     print('integral(f, 0, 2)=', integral(f, 0, 2))
-    theorem1(f, 2)
\ No newline at end of file
+    print('integral(f, 0, 2, adaptive)=', integral(f, 0, 2, 'adaptive', full_output=True))
+    theorem1(f, 2)
+    theorem1(f, 2, 'adaptive')
+    theorem1(f, 2, 'cumulative')
+    print('theorem1_array max error =', theorem1_array(f, np.linspace(0, 2, 200)))
+    for method in ['forward', 'central', 'richardson', 'complex']:
+        print(f'df(f, 2, {method!r})=', df(f, 2, method))
+    print('df_array(f, [1, 2, 3])=', df_array(f, [1, 2, 3]))
+    print('df_array(f, [1, 2, 3], central)=', df_array(f, [1, 2, 3], 'central'))
+    print('integral_array(f, 0, [1, 2, 3])=', integral_array(f, 0, [1, 2, 3]))
@@ -1,107 +1,537 @@
+import functools
+from collections import OrderedDict
 import numpy as np
-import matplotlib.pyplot as plt
 
 # We use numpy only for array management (storing data) and pi.
 # We will NOT use numpy.fft or any Fourier packages.
 
-def dft(x):
+def dft(x, axis=-1):
     """
     Computes the Discrete Fourier Transform (Forward).
     Corresponds to: F(omega) = integral f(x) * e^(-i * omega * x)
+    Transforms along `axis`; all other axes are independent signals.
     """
-    N = len(x)
-    # Create an empty array of complex numbers for the result
-    X = np.zeros(N, dtype=complex)
-    
-    # Nested loops to simulate the summation (The O(N^2) algorithm)
+    x = np.moveaxis(np.asarray(x), axis, -1)
+    N = x.shape[-1]
+    plan = get_plan(N)
+
+    # The kernel e^(-2*pi*i*k*n/N) only depends on k*n mod N, so it is read
+    # from the plan's table of N roots of unity instead of recomputing
+    # cos/sin. For small N the plan keeps the whole DFT matrix and the
+    # transform is a single matrix-vector product.
+    # (The matrix is symmetric, so x @ matrix works row by row.)
+    if N <= DFT_MATRIX_SIZE:
+        return np.moveaxis(x @ plan.matrix, -1, axis)
+
+    # Still the O(N^2) sum, one row of the matrix at a time
+    X = np.zeros(x.shape, dtype=complex)
+    n = np.arange(N)
     for k in range(N):  # For each frequency component k
-        sum_val = 0.0 + 0.0j
-        for n in range(N):  # For each time sample n
-            # The angle theta = -2 * pi * k * n / N
-            theta = -2 * np.pi * k * n / N
-            
-            # e^(theta) = cos(theta) + i*sin(theta)
-            # This is the "kernel" of the transform
-            complex_exponential = np.cos(theta) + 1j * np.sin(theta)
-            
-            # Summation
-            sum_val += x[n] * complex_exponential
-            
-        X[k] = sum_val
-        
-    return X
+        X[..., k] = x @ plan.roots[(k * n) % N]
+    return np.moveaxis(X, -1, axis)
 
-def idft(X):
+def idft(X, axis=-1):
     """
     Computes the Inverse Discrete Fourier Transform.
     Corresponds to: f(x) = (1/2pi) * integral F(omega) * e^(i * omega * x)
     """
-    N = len(X)
-    x_reconstructed = np.zeros(N, dtype=complex)
-    
-    for n in range(N):
-        sum_val = 0.0 + 0.0j
-        for k in range(N):
-            # The angle theta = 2 * pi * k * n / N (Positive for Inverse)
-            theta = 2 * np.pi * k * n / N
-            
-            # e^(theta)
-            complex_exponential = np.cos(theta) + 1j * np.sin(theta)
-            
-            sum_val += X[k] * complex_exponential
-            
-        # Apply the normalization factor (1/N)
-        # This matches the 1/2pi factor in the continuous formula context
-        x_reconstructed[n] = sum_val / N
-        
-    return x_reconstructed
+    X = np.asarray(X)
+    N = X.shape[axis]
+    # e^(+i theta) is the conjugate of the forward kernel, so
+    # idft(X) = conj(dft(conj(X))) / N reuses the same plan.
+    # The 1/N factor matches the 1/2pi factor in the continuous formula context
+    return np.conj(dft(np.conj(X), axis)) / max(N, 1)
+
+# --- Transform plans ---
+# Everything that only depends on N (roots of unity, the DFT matrix,
+# twiddle factors, Bluestein chirps) is computed once per N and kept
+# in a small LRU cache, so transforming many frames of the same length
+# does not repeat that work.
+
+DFT_MATRIX_SIZE = 1024    # dft/idft use a full N x N matrix up to this N
+FFT_MATRIX_SIZE = 64      # fft/ifft use the matrix instead of butterflies up to this N
+# Room for the plans of one transform of about 2**22 samples (a Bluestein
+# plan for N = 10**6 and its 2**21 sub-plan take about 80 MB together)
+PLAN_CACHE_BYTES = 256 * 2**20
+
+class FFTPlan:
+    """Precomputed tables for transforms of length N."""
+
+    def __init__(self, N):
+        self.N = N
+        n = np.arange(N)
+        self._roots = None
+        self._matrix = None
+        if N & (N - 1) == 0:
+            # The stage that merges transforms of length r uses
+            # w^k = e^(-i pi k/r), k < r: every (N/2r)-th root of unity.
+            # The twiddles are copies, so the full table is not kept.
+            self.n0 = min(N, FFT_MATRIX_SIZE)
+            stages = [self.n0 << i for i in range((N // max(self.n0, 1)).bit_length() - 1)]
+            roots = self.roots if N <= FFT_MATRIX_SIZE else np.exp(-2j * np.pi * n / max(N, 1))
+            self.twiddles = [roots[::N // (2 * r)][:r, None].copy() for r in stages]
+        else:
+            self.M = 1 << (2 * N - 2).bit_length()
+            # n^2 mod 2N keeps the angle small, so the chirp stays accurate for large N
+            self.chirp = np.exp(-1j * np.pi * ((n * n) % (2 * N)) / N)
+            b = np.zeros(self.M, dtype=complex)
+            b[:N] = np.conj(self.chirp)
+            b[self.M - N + 1:] = np.conj(self.chirp[1:][::-1])
+            self.chirp_fft = fft_radix2(b)
+
+    @property
+    def roots(self):
+        """The N roots of unity e^(-2 pi i n/N), built on first use."""
+        if self._roots is None:
+            self._roots = np.exp(-2j * np.pi * np.arange(self.N) / max(self.N, 1))
+        return self._roots
+
+    @property
+    def matrix(self):
+        """The N x N DFT matrix, built on first use."""
+        if self._matrix is None:
+            n = np.arange(self.N)
+            self._matrix = self.roots[np.outer(n, n) % max(self.N, 1)]
+        return self._matrix
+
+    @property
+    def nbytes(self):
+        arrays = [v for v in vars(self).values() if isinstance(v, np.ndarray)]
+        arrays += getattr(self, 'twiddles', [])
+        return sum(a.nbytes for a in arrays)
+
+_plans = OrderedDict()
+_plans_in_use = set()  # lengths used by the transform in progress
+_transform_depth = 0
+
+def get_plan(N):
+    """Cached FFTPlan for length N; least recently used plans are dropped
+    once the cache holds more than PLAN_CACHE_BYTES, except the plans
+    used by the transform in progress (e.g. a Bluestein plan and the
+    power-of-2 plans of its convolution)."""
+    plan = _plans.pop(N, None)
+    if plan is None:
+        plan = FFTPlan(N)
+    _plans[N] = plan
+    if _transform_depth:
+        _plans_in_use.add(N)
+    trim_plans()
+    return plan
+
+def trim_plans():
+    size = sum(p.nbytes for p in _plans.values())
+    for key in list(_plans):
+        if size <= PLAN_CACHE_BYTES:
+            break
+        if key not in _plans_in_use:
+            size -= _plans.pop(key).nbytes
+
+def uses_plans(transform):
+    """Keeps the plans a transform uses cached until its outermost call
+    returns; nested transforms share the same set."""
+    @functools.wraps(transform)
+    def wrapper(*args, **kwargs):
+        global _transform_depth
+        _transform_depth += 1
+        try:
+            return transform(*args, **kwargs)
+        finally:
+            _transform_depth -= 1
+            if _transform_depth == 0:
+                _plans_in_use.clear()
+                trim_plans()
+    return wrapper
+
+# --- Fast Fourier Transform ---
+# Same result as dft/idft in O(N log N). The internal functions work on the
+# last axis, so a 2-D array is transformed row by row in one call; the
+# public ones move `axis` there first.
+
+@uses_plans
+def fft_radix2(x):
+    """
+    Iterative Cooley-Tukey FFT, N must be a power of 2.
+    Viewing x as an (n0, N/n0) array, column c holds the samples
+    c, c + N/n0, ...; one matrix product gives the n0-point DFT of every
+    column. Each stage then merges the transforms of columns c and
+    c + cols/2 (even and odd samples of a twice longer sequence):
+    X[k] = E[k] + w^k O[k],  X[k + r] = E[k] - w^k O[k]
+    All operations run on whole rows, so no bit-reversal is needed.
+    """
+    N = x.shape[-1]
+    plan = get_plan(N)
+    batch = x.shape[:-1]
+    X = get_plan(plan.n0).matrix @ x.reshape(batch + (plan.n0, N // max(plan.n0, 1)))
+    for w in plan.twiddles:
+        half = X.shape[-1] // 2
+        even = X[..., :half]
+        odd = X[..., half:] * w
+        X = np.concatenate([even + odd, even - odd], axis=-2)
+    return X.reshape(batch + (N,))
+
+@uses_plans
+def fft_bluestein(x):
+    """
+    Bluestein's chirp-z FFT for any N.
+    Using kn = (k^2 + n^2 - (k-n)^2) / 2, the DFT becomes a convolution
+    with a chirp, which is done with power-of-2 FFTs of length M >= 2N-1.
+    """
+    N = x.shape[-1]
+    plan = get_plan(N)
+    a = np.zeros(x.shape[:-1] + (plan.M,), dtype=complex)
+    a[..., :N] = x * plan.chirp
+    conv = ifft(fft_radix2(a) * plan.chirp_fft)
+    return plan.chirp * conv[..., :N]
+
+@uses_plans
+def fft(x, axis=-1):
+    """Fast forward transform, same result as dft(x, axis)."""
+    x = np.moveaxis(np.asarray(x), axis, -1)
+    N = x.shape[-1]
+    if N == 0:
+        X = x.astype(complex)
+    elif N <= FFT_MATRIX_SIZE:
+        X = x @ get_plan(N).matrix
+    elif N & (N - 1) == 0:
+        X = fft_radix2(x)
+    else:
+        X = fft_bluestein(x)
+    return np.moveaxis(X, -1, axis)
+
+def ifft(X, axis=-1):
+    """Fast inverse transform, same result as idft(X, axis): conj(fft(conj(X))) / N."""
+    X = np.asarray(X)
+    N = X.shape[axis]
+    return np.conj(fft(np.conj(X), axis)) / max(N, 1)
+
+def fftn(x, axes=None):
+    """
+    N-D transform, one 1-D transform per axis (row-column method).
+    Each pass is a batched fft over all the other axes. axes defaults to all.
+    """
+    x = np.asarray(x)
+    for axis in range(x.ndim) if axes is None else axes:
+        x = fft(x, axis)
+    return x
+
+def ifftn(X, axes=None):
+    """Inverse of fftn."""
+    X = np.asarray(X)
+    for axis in range(X.ndim) if axes is None else axes:
+        X = ifft(X, axis)
+    return X
+
+def fft2(x):
+    """2-D transform over the last two axes (e.g. images, or a stack of them)."""
+    return fftn(x, (-2, -1))
+
+def ifft2(X):
+    """Inverse of fft2."""
+    return ifftn(X, (-2, -1))
+
+# --- Real-input transforms ---
+# For real x the spectrum is Hermitian, X[N-k] = conj(X[k]), so only the
+# N//2 + 1 bins k = 0..N/2 carry information. For even N the real signal
+# is packed into a complex one of half the length, z = x[0::2] + i x[1::2],
+# and a single N/2-point FFT gives the spectra E, O of the even and odd
+# samples: X[k] = E[k] + w^k O[k], w = e^(-2 pi i / N).
+
+@uses_plans
+def rfft(x, axis=-1):
+    """Transform of real x along `axis`, bins 0..N//2 of dft(x, axis)."""
+    x = np.moveaxis(np.asarray(x, dtype=float), axis, -1)
+    N = x.shape[-1]
+    if N % 2 or N < 2:
+        return np.moveaxis(fft(x)[..., :N // 2 + 1], -1, axis)
+    M = N // 2
+    Z = fft(x[..., 0::2] + 1j * x[..., 1::2])
+    Z = np.concatenate([Z, Z[..., :1]], axis=-1)  # Z[M] = Z[0]
+    Zc = np.conj(Z[..., ::-1])                    # conj(Z[M-k])
+    E = (Z + Zc) / 2
+    O = (Z - Zc) / 2j
+    return np.moveaxis(E + get_plan(N).roots[:M + 1] * O, -1, axis)
+
+@uses_plans
+def irfft(X, n=None, axis=-1):
+    """Inverse of rfft: real signal of length n (default 2 * (len(X) - 1))."""
+    X = np.moveaxis(np.asarray(X, dtype=complex), axis, -1)
+    n = 2 * (X.shape[-1] - 1) if n is None else n
+    # Exactly the n//2 + 1 bins of a length-n signal (truncated or zero
+    # padded), with the imaginary parts of the self-conjugate bins 0 and,
+    # for even n, n/2 dropped as numpy.fft.irfft does.
+    bins = n // 2 + 1
+    X = X[..., :bins]
+    X = np.concatenate([X, np.zeros(X.shape[:-1] + (bins - X.shape[-1],))], axis=-1)
+    X[..., 0] = X[..., 0].real
+    if n % 2 == 0:
+        X[..., -1] = X[..., -1].real
+    if n % 2 or n < 2:
+        # Rebuild the full Hermitian spectrum
+        full = np.zeros(X.shape[:-1] + (n,), dtype=complex)
+        full[..., :bins] = X
+        full[..., bins:] = np.conj(X[..., 1:(n + 1) // 2][..., ::-1])
+        return np.moveaxis(np.real(ifft(full)), -1, axis)
+    M = n // 2
+    Xc = np.conj(X[..., ::-1])                    # conj(X[M-k])
+    E = (X + Xc) / 2
+    O = (X - Xc) / (2 * get_plan(n).roots[:M + 1])
+    z = ifft((E + 1j * O)[..., :M])
+    x = np.empty(X.shape[:-1] + (n,))
+    x[..., 0::2] = z.real
+    x[..., 1::2] = z.imag
+    return np.moveaxis(x, -1, axis)
+
+# --- Convolution and correlation ---
+# Convolution in time is multiplication of spectra, so with zero padding to
+# L >= N + M - 1 (no wrap-around) a length-N signal and a length-M filter
+# are convolved in O(L log L) instead of O(N M).
+
+DIRECT_CONV_SIZE = 128  # filters up to this length are convolved directly
+
+def next_pow2(n):
+    return 1 << max(n - 1, 0).bit_length()
+
+def convolve(x, h, method='auto'):
+    """
+    Full linear convolution, y[n] = sum_m x[m] h[n-m], length N + M - 1.
+    method: 'direct' (sum of shifted products), 'fft' (one padded
+    transform), 'overlap_save' (block processing) or 'auto', which picks
+    direct for short filters, overlap-save when the signal is much longer
+    than the filter and a single transform otherwise.
+    """
+    x, h = np.asarray(x), np.asarray(h)
+    if len(x) < len(h):
+        x, h = h, x
+    N, M = len(x), len(h)
+    if M == 0:
+        return np.zeros(0, dtype=np.result_type(x, h))
+    if method == 'auto':
+        if M <= DIRECT_CONV_SIZE:
+            method = 'direct'
+        elif N > 8 * M:
+            method = 'overlap_save'
+        else:
+            method = 'fft'
+    if method == 'direct':
+        # Loop over the shorter sequence, vectorized over the longer one
+        y = np.zeros(N + M - 1, dtype=np.result_type(x, h, float))
+        for m in range(M):
+            y[m:m + N] += h[m] * x
+        return y
+    if method == 'overlap_save':
+        return overlap_save(x, h)
+    if method != 'fft':
+        raise ValueError(f"Unknown convolution method: {method}")
+    L = next_pow2(N + M - 1)
+    if np.isrealobj(x) and np.isrealobj(h):
+        return irfft(rfft(pad(x, L)) * rfft(pad(h, L)), L)[:N + M - 1]
+    return ifft(fft(pad(x, L)) * fft(pad(h, L)))[:N + M - 1]
+
+def correlate(x, y, method='auto'):
+    """
+    Full cross-correlation c[k] = sum_n x[n + k] conj(y[n]), with lags from
+    -(len(y) - 1) to len(x) - 1 (same layout as np.correlate(x, y, 'full')).
+    """
+    return convolve(x, np.conj(np.asarray(y)[::-1]), method)
+
+def pad(x, L):
+    """x followed by zeros up to length L."""
+    out = np.zeros(L, dtype=x.dtype)
+    out[:len(x)] = x
+    return out
+
+def overlap_save(x, h, block_size=None, batch=256):
+    """
+    Full convolution of a long x with a short h, one transform size at a time.
+    x is cut into overlapping blocks of block_size (default: a power of 2 of
+    at least 8 len(h)); each block is convolved circularly with h and the
+    first len(h) - 1 outputs, which wrapped around, are dropped. `batch`
+    blocks go through one batched transform, bounding the memory used.
+    """
+    x, h = np.asarray(x), np.asarray(h)
+    N, M = len(x), len(h)
+    L = block_size or next_pow2(8 * M)
+    if L < M:
+        raise ValueError("block_size must be at least len(h)")
+    step = L - M + 1
+    real = np.isrealobj(x) and np.isrealobj(h)
+    H = rfft(pad(h, L)) if real else fft(pad(h, L))
+
+    total = N + M - 1
+    blocks = -(-total // step)
+    # M - 1 zeros in front give the start-up transient, zeros at the end
+    # complete the last block.
+    xp = np.zeros((M - 1) + blocks * step + (M - 1), dtype=np.result_type(x, float))
+    xp[M - 1:M - 1 + N] = x
+    y = np.zeros(blocks * step, dtype=np.result_type(x, h, float))
+    for b0 in range(0, blocks, batch):
+        b1 = min(b0 + batch, blocks)
+        frames = xp[np.arange(b0, b1)[:, None] * step + np.arange(L)]
+        if real:
+            Y = irfft(rfft(frames) * H, L)
+        else:
+            Y = ifft(fft(frames) * H)
+        y[b0 * step:b1 * step] = Y[:, M - 1:].reshape(-1)
+    return y[:total]
+
+# --- Streaming Short-Time Fourier Transform ---
+# stft() reads the signal as an iterable of chunks and yields one spectrum
+# per frame; istft() turns spectra back into chunks of samples by
+# weighted overlap-add. Only about one frame of samples is buffered, so
+# streams larger than memory can be processed.
+
+def hann(N):
+    """Periodic Hann window."""
+    return 0.5 - 0.5 * np.cos(2 * np.pi * np.arange(N) / N)
+
+def stft_setup(frame_size, hop, window):
+    """Default hop and window, checking that every sample can be recovered."""
+    hop = hop or frame_size // 2
+    window = hann(frame_size) if window is None else np.asarray(window)
+    if not 0 < hop <= frame_size or window.shape != (frame_size,):
+        raise ValueError("Need 0 < hop <= frame_size and a window of frame_size samples")
+    # Sum of the squared windows of all frames covering each sample
+    weight = np.zeros(-(-frame_size // hop) * hop)
+    weight[:frame_size] = window ** 2
+    if np.any(weight.reshape(-1, hop).sum(axis=0) <= 1e-12):
+        raise ValueError("The overlapping windows leave some samples with zero weight")
+    return hop, window
+
+def stft(chunks, frame_size, hop=None, window=None):
+    """
+    Yields the transform (same as dft) of each windowed frame of the stream.
+    Frames start every `hop` samples (default frame_size // 2). The stream is
+    padded with frame_size - hop zeros in front, so the first samples are
+    covered by as many frames as the rest, and zero-padded at the end up to
+    the last frame.
+    """
+    hop, window = stft_setup(frame_size, hop, window)
+    overlap = frame_size - hop
+    buffer = np.zeros(overlap)
+    for chunk in chunks:
+        buffer = np.concatenate([buffer, np.asarray(chunk)])
+        count = (len(buffer) - frame_size) // hop + 1 if len(buffer) >= frame_size else 0
+        if count:
+            # All complete frames in the buffer in one batched transform
+            frames = buffer[np.arange(count)[:, None] * hop + np.arange(frame_size)]
+            yield from fft(frames * window)
+            buffer = buffer[count * hop:]
+    # The last overlap samples of the buffer are already covered by earlier
+    # frames, anything after that still needs zero-padded frames.
+    while len(buffer) > overlap:
+        frame = np.zeros(frame_size, dtype=buffer.dtype)
+        frame[:min(len(buffer), frame_size)] = buffer[:frame_size]
+        yield fft(frame * window)
+        buffer = buffer[hop:]
+
+def istft(spectra, frame_size, hop=None, window=None):
+    """
+    Inverse of stft(): yields the reconstructed samples in chunks of `hop`.
+    Each frame is transformed back (same as idft), windowed again and
+    overlap-added; dividing by the overlap-added squared window undoes
+    both windows. The output ends with the zero padding added by stft().
+    """
+    hop, window = stft_setup(frame_size, hop, window)
+    skip = frame_size - hop
+    out = np.zeros(frame_size, dtype=complex)
+    weight = np.zeros(frame_size)
+    for spectrum in spectra:
+        out += ifft(spectrum) * window
+        weight += window ** 2
+        chunk = out[:hop] / np.where(weight[:hop] > 1e-12, weight[:hop], 1)
+        out = np.concatenate([out[hop:], np.zeros(hop)])
+        weight = np.concatenate([weight[hop:], np.zeros(hop)])
+        # Drop the zeros stft() put in front of the stream
+        if skip >= hop:
+            skip -= hop
+            continue
+        yield chunk[skip:]
+        skip = 0
+    # Samples after the last hop are only covered by the frames seen so far
+    tail = frame_size - hop
+    yield out[skip:tail] / np.where(weight[skip:tail] > 1e-12, weight[skip:tail], 1)
+
+# --- Visualization ---
+
+def plot_transform(t, f_original, f_recovered_real, F_transformed):
+    """Plots the original and recovered signal and the DFT magnitude."""
+    # matplotlib is only needed here, so importing this module for the
+    # transforms does not load it (or need a display).
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=(10, 6))
+    plt.subplot(2, 1, 1)
+    plt.plot(t, f_original, 'b-', label='Original f(x)', linewidth=2)
+    plt.plot(t, f_recovered_real, 'r--', label='Recovered f(x) via IDFT', linewidth=2)
+    plt.legend()
+    plt.title("Original vs Recovered Signal")
+
+    plt.subplot(2, 1, 2)
+    plt.stem(np.abs(F_transformed))
+    plt.title("Magnitude of F(omega) [DFT]")
+    plt.tight_layout()
+    plt.show()
 
 # --- 3. Verification Step ---
 
-# A. Generate a sample function f(x)
-# Let's create a signal composed of two sine waves
-N = 64  # Number of samples
-t = np.linspace(0, 1, N) # Time vector
-# Signal: 1Hz sine wave + 5Hz sine wave
-f_original = np.sin(2 * np.pi * 1 * t) + 0.5 * np.sin(2 * np.pi * 5 * t)
-
-print(f"Original Signal (First 5 samples):\n{f_original[:5]}\n")
-
-# B. Perform Forward Transform: dft(f)
-F_transformed = dft(f_original)
-print(f"Transformed Frequency Data (First 5 samples):\n{F_transformed[:5]}\n")
-
-# C. Perform Inverse Transform: idft(F)
-f_recovered = idft(F_transformed)
-
-# We take the real part because the original signal was real.
-# (Small imaginary parts might exist due to floating point rounding errors)
-f_recovered_real = np.real(f_recovered)
-print(f"Recovered Signal (First 5 samples):\n{f_recovered_real[:5]}\n")
-
-# D. Verify equality
-# Check if the difference is extremely small (close to zero)
-mse = np.mean((f_original - f_recovered_real)**2)
-is_close = np.allclose(f_original, f_recovered_real)
-
-print("-" * 30)
-print(f"Mean Squared Error: {mse:.20f}")
-if is_close:
-    print("VERIFICATION SUCCESSFUL: The recovered function matches the original function.")
-else:
-    print("VERIFICATION FAILED: The functions do not match.")
-
-# Optional: Visualization (if running in a local environment)
-#  would be generated here in a real notebook
-plt.figure(figsize=(10, 6))
-plt.subplot(2, 1, 1)
-plt.plot(t, f_original, 'b-', label='Original f(x)', linewidth=2)
-plt.plot(t, f_recovered_real, 'r--', label='Recovered f(x) via IDFT', linewidth=2)
-plt.legend()
-plt.title("Original vs Recovered Signal")
-
-plt.subplot(2, 1, 2)
-plt.stem(np.abs(F_transformed))
-plt.title("Magnitude of F(omega) [DFT]")
-plt.tight_layout()
-plt.show()
+def main():
+    # A. Generate a sample function f(x)
+    # Let's create a signal composed of two sine waves
+    N = 64  # Number of samples
+    t = np.linspace(0, 1, N) # Time vector
+    # Signal: 1Hz sine wave + 5Hz sine wave
+    f_original = np.sin(2 * np.pi * 1 * t) + 0.5 * np.sin(2 * np.pi * 5 * t)
+
+    print(f"Original Signal (First 5 samples):\n{f_original[:5]}\n")
+
+    # B. Perform Forward Transform: dft(f)
+    F_transformed = dft(f_original)
+    print(f"Transformed Frequency Data (First 5 samples):\n{F_transformed[:5]}\n")
+
+    # C. Perform Inverse Transform: idft(F)
+    f_recovered = idft(F_transformed)
+
+    # We take the real part because the original signal was real.
+    # (Small imaginary parts might exist due to floating point rounding errors)
+    f_recovered_real = np.real(f_recovered)
+    print(f"Recovered Signal (First 5 samples):\n{f_recovered_real[:5]}\n")
+
+    # D. Verify equality
+    # Check if the difference is extremely small (close to zero)
+    mse = np.mean((f_original - f_recovered_real)**2)
+    is_close = np.allclose(f_original, f_recovered_real)
+
+    print("-" * 30)
+    print(f"Mean Squared Error: {mse:.20f}")
+    if is_close:
+        print("VERIFICATION SUCCESSFUL: The recovered function matches the original function.")
+    else:
+        print("VERIFICATION FAILED: The functions do not match.")
+
+    # E. Cross-check the fast transforms against the direct ones
+    print(f"fft vs dft max difference:   {np.max(np.abs(fft(f_original) - F_transformed)):.3e}")
+    print(f"ifft vs idft max difference: {np.max(np.abs(ifft(F_transformed) - f_recovered)):.3e}")
+
+    print(f"rfft vs dft max difference:  {np.max(np.abs(rfft(f_original) - F_transformed[:N // 2 + 1])):.3e}")
+    print(f"irfft max difference:        {np.max(np.abs(irfft(rfft(f_original), N) - f_original)):.3e}")
+
+    # F. Stream the signal through stft/istft in chunks of 10 samples
+    chunks = (f_original[i:i + 10] for i in range(0, N, 10))
+    f_streamed = np.real(np.concatenate(list(istft(stft(chunks, 16), 16))))[:N]
+    print(f"stft/istft max difference:   {np.max(np.abs(f_streamed - f_original)):.3e}")
+
+    # G. Filter the signal with a 5-point moving average, both ways
+    h = np.ones(5) / 5
+    print(f"convolve fft vs direct:      {np.max(np.abs(convolve(f_original, h, 'fft') - convolve(f_original, h, 'direct'))):.3e}")
+
+    # H. 2-D transform of an outer product factorizes into 1-D transforms
+    image = np.outer(f_original, np.cos(2 * np.pi * 3 * t))
+    expected = np.outer(F_transformed, dft(np.cos(2 * np.pi * 3 * t)))
+    print(f"fft2 vs 1-D dft max diff:    {np.max(np.abs(fft2(image) - expected)):.3e}")
+
+    # Optional: Visualization (if running in a local environment)
+    #  would be generated here in a real notebook
+    plot_transform(t, f_original, f_recovered_real, F_transformed)
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 import numpy as np
+from hw4 import cluster_roots, refine_roots
 
 def solve_ode_general(coefficients):
     """
@@ -12,7 +13,9 @@ def solve_ode_general(coefficients):
     # 2. Group roots with a tolerance to handle floating point noise.
     # We treat 1.999999999 and 2.000000001 as the same root (2).
     # We treat 1e-15j as 0 (real).
-    groups = group_roots(raw_roots)
+    # Passing the coefficients also polishes each group against the
+    # polynomial, which repeated roots from np.roots badly need.
+    groups = group_roots(raw_roots, coefficients=coefficients)
     
     # 3. Construct the solution string
     terms = []
@@ -60,32 +63,25 @@ def solve_ode_general(coefficients):
     
     return f"y(x) = {solution}"
 
-def group_roots(roots, tol=1e-5):
+def group_roots(roots, tol=1e-5, coefficients=None):
     """
     Groups roots that are numerically close to each other.
     Returns a list of dicts: [{'value': representative_root, 'count': multiplicity}, ...]
+    If the polynomial coefficients (highest power first, as for np.roots)
+    are given, each representative is also polished with Newton's method.
     """
-    groups = []
-    used_indices = set()
-    
-    for i, r1 in enumerate(roots):
-        if i in used_indices:
-            continue
-            
-        current_group = [r1]
-        used_indices.add(i)
-        
-        for j, r2 in enumerate(roots):
-            if j not in used_indices and j > i: # j > i ensures we don't look back
-                if np.isclose(r1, r2, atol=tol):
-                    current_group.append(r2)
-                    used_indices.add(j)
-        
+    roots = np.asarray(roots)
+    if coefficients is not None:
+        # hw4 stores coefficients constant term first
+        c = np.trim_zeros(np.asarray(coefficients), 'f')[::-1]
+        values, counts = refine_roots(c, roots, atol=tol)
+    else:
         # Calculate average value for the group to minimize error
-        avg_val = np.mean(current_group)
-        groups.append({'value': avg_val, 'count': len(current_group)})
+        clusters = cluster_roots(roots, atol=tol)
+        values = [np.mean(roots[g]) for g in clusters]
+        counts = [len(g) for g in clusters]
         
-    return groups
+    return [{'value': complex(v), 'count': int(m)} for v, m in zip(values, counts)]
 
 def format_real_term(c_idx, power_x, alpha):
     """Formats C_i x^k e^(ax)"""
@@ -1,4 +1,5 @@
 import cmath
+import numpy as np
 
 def root2(a, b, c):
     D = b**2 - 4*a*c
@@ -8,7 +9,27 @@ def root2(a, b, c):
     
     return r1, r2
 
+def root2_array(a, b, c):
+    # Broadcasts over arrays of coefficients. One root comes from
+    # q = -(b + s*sqrt(D))/2 with the sign s chosen so that b and s*sqrt(D)
+    # do not cancel, the other from Vieta's r1*r2 = c/a, i.e. c/q.
+    a, b, c = np.broadcast_arrays(*(np.asarray(v, dtype=complex) for v in (a, b, c)))
+    # + 0 turns a -0.0 imaginary part into +0.0, so a negative real D gets
+    # the same +i*sqrt(|D|) branch as cmath.sqrt.
+    sqrt_D = np.sqrt(b**2 - 4*a*c + 0)
+    plus = (b.conjugate()*sqrt_D).real >= 0
+    q = -(b + np.where(plus, sqrt_D, -sqrt_D))/2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        big = q/a
+        small = np.where(q == 0, 0, c/q)
+    # Keep root2's order: r1 uses +sqrt(D), r2 uses -sqrt(D).
+    r1 = np.where(plus, small, big)
+    r2 = np.where(plus, big, small)
+    return r1, r2
+
 if __name__ == "__main__":
     print(root2(1, -5, 6))
     print(root2(1, 4, 3))    
-    print(root2(1, 1, 1))    
\ No newline at end of file
+    print(root2(1, 1, 1))
+    print(root2_array([1, 1, 1], [-5, 4, 1], [6, 3, 1]))
+    print(root2_array(1, 1e8, 1))    
\ No newline at end of file
@@ -1,4 +1,5 @@
 import cmath
+import numpy as np
 
 def solve_cubic(a, b, c, d):
     if a == 0:
@@ -14,9 +15,12 @@ def solve_cubic(a, b, c, d):
     # Discriminant
     Δ = (q/2)**2 + (p/3)**3
 
-    # Cube roots
+    # Cube roots, paired so that u*v = -p/3 (independent principal cube
+    # roots can pick the wrong pair and give wrong roots)
     u = (-q/2 + cmath.sqrt(Δ))**(1/3)
-    v = (-q/2 - cmath.sqrt(Δ))**(1/3)
+    if u == 0:
+        u = (-q/2 - cmath.sqrt(Δ))**(1/3)
+    v = -p/(3*u) if u != 0 else 0
 
     t1 = u + v
     t2 = -(u+v)/2 + (u-v)*cmath.sqrt(3)/2j
@@ -25,6 +29,52 @@ def solve_cubic(a, b, c, d):
     # Back-substitute x = t - b/3
     return [t1 - b/3, t2 - b/3, t3 - b/3]
 
+def solve_cubic_array(a, b, c, d, polish=0):
+    # Real coefficient arrays of any (broadcastable) shape -> roots of shape
+    # (..., 3). Three real roots (Δ <= 0) use the trigonometric method,
+    # otherwise Cardano with real cube roots. `polish` Newton steps on the
+    # original polynomial clean up the last bits.
+    a, b, c, d = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (a, b, c, d)))
+    if np.any(a == 0):
+        raise ValueError("Not a cubic equation")
+    b, c, d = b/a, c/a, d/a
+
+    p = c - b**2/3
+    q = 2*b**3/27 - b*c/3 + d
+    Δ = (q/2)**2 + (p/3)**3
+
+    t = np.empty(a.shape + (3,), dtype=complex)
+
+    # Three real roots: t_k = m*cos(θ/3 - 2πk/3), m = 2*sqrt(-p/3)
+    real = Δ <= 0
+    m = 2*np.sqrt(np.maximum(-p, 0)/3)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cos3 = np.where(m > 0, 4*q/np.where(m > 0, -m**3, 1), 0)
+    θ = np.arccos(np.clip(cos3, -1, 1))
+    k = np.arange(3)
+    t_real = m[..., None]*np.cos(θ[..., None]/3 - 2*np.pi*k/3)
+
+    # One real root: u = cbrt(-q/2 ∓ sqrt(Δ)) with the sign that avoids
+    # cancellation, v = -p/(3u)
+    sqrt_Δ = np.sqrt(np.maximum(Δ, 0))
+    u = np.cbrt(-q/2 - np.copysign(sqrt_Δ, q))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        v = np.where(u != 0, -p/(3*np.where(u != 0, u, 1)), 0)
+    pair = -(u+v)/2 + 1j*np.sqrt(3)/2*(u-v)
+    t_cardano = np.stack([u+v, pair, pair.conjugate()], axis=-1)
+
+    t[...] = np.where(real[..., None], t_real, t_cardano)
+    x = t - (b/3)[..., None]
+
+    b, c, d = b[..., None], c[..., None], d[..., None]
+    for _ in range(polish):
+        f = ((x + b)*x + c)*x + d
+        df = (3*x + 2*b)*x + c
+        safe = df != 0
+        x = x - np.where(safe, f/np.where(safe, df, 1), 0)
+    return x
+
 if __name__ == "__main__":
     print(solve_cubic(1, -6, 11, -6))
-    print(solve_cubic(1, -9, 26, -24))
\ No newline at end of file
+    print(solve_cubic(1, -9, 26, -24))
+    print(solve_cubic_array([1, 1, 1], [-6, -9, 0], [11, 26, 0], [-6, -24, -1], polish=2))
\ No newline at end of file
@@ -1,27 +1,284 @@
 import numpy as np
 
-def root(c):
+def root(c, method='companion', z0=None, tol=1e-12, maxiter=100, full_output=False, polish=False):
+    # method='aberth' uses the simultaneous iteration below instead of the
+    # companion matrix; z0 warm-starts it from a previous set of roots.
+    # With full_output=True, returns (roots, info) where info reports the
+    # number of iterations and whether every root converged.
+    # polish=True passes the roots through refine_roots(), which fixes the
+    # accuracy of repeated roots (each is returned multiplicity times).
 
     while len(c) > 1 and abs(c[-1]) < 1e-14:
         c.pop()
 
     n = len(c) - 1
+    info = {'method': method, 'iterations': 0, 'converged': True}
     if n == 0:
-        return []
+        return ([], info) if full_output else []
     if n == 1:
-        return [-c[0] / c[1]]
+        roots = [-c[0] / c[1]]
+        return (roots, info) if full_output else roots
 
     c = [ci / c[-1] for ci in c]
 
-    companion = np.zeros((n, n))
-    companion[1:, :-1] = np.eye(n-1)
-    companion[:, -1] = -np.array(c[:-1])
+    if method == 'aberth':
+        roots, info['iterations'], info['converged'] = aberth(c, z0, tol, maxiter)
+    elif method == 'companion':
+        companion = np.zeros((n, n))
+        companion[1:, :-1] = np.eye(n-1)
+        companion[:, -1] = -np.array(c[:-1])
+
+        roots = np.linalg.eigvals(companion)
+    else:
+        raise ValueError(f"Unknown root finding method: {method}")
+
+    if polish:
+        values, counts = refine_roots(c, roots)
+        roots = np.repeat(values, counts)
+    return (roots, info) if full_output else roots
+
+def newton_ratio(c, z):
+    # p(z)/p'(z) for every z, by Horner's rule. For |z| > 1 the reversed
+    # polynomial is evaluated at 1/z instead, so high degrees do not overflow.
+    c = np.asarray(c, dtype=complex)
+    z = np.asarray(z, dtype=complex)
+    n = len(c) - 1
+    ratio = np.empty_like(z)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        inside = np.abs(z) <= 1
+        x = z[inside]
+        p, dp = np.full_like(x, c[-1]), np.zeros_like(x)
+        for ci in c[-2::-1]:
+            dp = dp*x + p
+            p = p*x + ci
+        ratio[inside] = p/dp
+
+        # p(z) = z^n r(w), w = 1/z, r(w) = c[n] + c[n-1] w + ... + c[0] w^n
+        x = z[~inside]
+        w = 1/x
+        r, dr = np.full_like(x, c[0]), np.zeros_like(x)
+        for ci in c[1:]:
+            dr = dr*w + r
+            r = r*w + ci
+        ratio[~inside] = x*r/(n*r - w*dr)
+    return ratio
 
-    roots = np.linalg.eigvals(companion)
+def separate(z, scale):
+    # Moves the repeats of a coincident value apart (the k-th repeat by
+    # about k*1e-3*scale, in a direction that changes with k). The Aberth
+    # correction contains 1/(z_i - z_j), so equal points would never move.
+    z = z.copy()
+    order = np.lexsort((z.imag, z.real))
+    zs = z[order]
+    repeat = np.concatenate(([False], zs[1:] == zs[:-1]))
+    start = np.maximum.accumulate(np.where(repeat, 0, np.arange(len(z))))
+    k = np.arange(len(z)) - start
+    z[order] = zs + 1e-3*scale*k*np.exp(1j*(0.4 + 2.4*k))
+    return z
+
+def aberth(c, z0=None, tol=1e-12, maxiter=100):
+    # Aberth-Ehrlich iteration: all n roots are updated together, O(n^2)
+    # work and O(n) memory per iteration. Roots whose correction drops
+    # below tol (relative) are frozen. Returns (roots, iterations, converged).
+    c = np.asarray(c, dtype=complex)
+    n = len(c) - 1
+    center = -c[-2]/(n*c[-1])
+    radius = abs(c[0]/c[-1])**(1/n) if c[0] != 0 else 1.0
+    circle = center + radius*np.exp(1j*(2*np.pi*np.arange(n)/n + 0.4))
+    if z0 is None:
+        z = circle
+    else:
+        z = np.array(z0, dtype=complex)
+        if z.shape != (n,):
+            raise ValueError(f"z0 must contain {n} initial roots")
+        # A warm start may repeat a multiple root or contain inf/nan
+        z = np.where(np.isfinite(z), z, circle)
+    scale = max(radius, abs(center), 1.0)
+    z = separate(z, scale)
+
+    active = np.arange(n)
+    block = max(1, 2**20 // n)
+    for iteration in range(1, maxiter+1):
+        za = z[active]
+        ratio = newton_ratio(c, za)
+        # sum over j != i of 1/(z_i - z_j), a block of rows at a time
+        s = np.empty_like(za)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for i in range(0, len(za), block):
+                d = za[i:i+block, None] - z[None, :]
+                d[np.arange(len(d)), active[i:i+block]] = np.inf
+                s[i:i+block] = (1/d).sum(axis=1)
+            step = ratio/(1 - ratio*s)
+        # Roots that collided (or hit 0/0) are nudged and stay active
+        bad = ~np.isfinite(step)
+        step[bad] = -1e-3*scale*np.exp(1j*(0.4 + 2.4*iteration + np.arange(bad.sum())))
+        z[active] = za - step
+        active = active[bad | (np.abs(step) > tol*np.maximum(np.abs(za), 1))]
+        if len(active) == 0:
+            return z, iteration, True
+    return z, maxiter, False
+
+def cluster_roots(roots, atol=1e-5, rtol=1e-5):
+    # Groups roots closer than atol + rtol*max(|r1|, |r2|) (transitively);
+    # atol may also be an array with one tolerance per root, then the larger
+    # of the two is used. Roots are bucketed on a grid whose cells are as
+    # wide as the largest such distance, so only roots in the same or a
+    # neighbouring cell are compared: O(n log n) unless many roots share a
+    # cell. Returns a list of index arrays, ordered by their first index.
+    roots = np.asarray(roots, dtype=complex)
+    n = len(roots)
+    if n == 0:
+        return []
+    size = np.abs(roots)
+    tol = np.broadcast_to(np.asarray(atol, dtype=float), (n,))
+    reach = tol.max() + rtol*size.max()
+
+    if reach > 0:
+        # Cell coordinates, renumbered densely so neighbours are +-1 apart
+        cx = np.floor(roots.real/reach)
+        cy = np.floor(roots.imag/reach)
+        ux = np.unique(np.concatenate((cx - 1, cx, cx + 1)))
+        uy = np.unique(np.concatenate((cy - 1, cy, cy + 1)))
+        rx = np.searchsorted(ux, cx)
+        ry = np.searchsorted(uy, cy)
+        key = rx*len(uy) + ry
+        order = np.argsort(key, kind='stable')
+        sorted_key = key[order]
+        first, second = [], []
+        # Each pair of neighbouring cells is visited once
+        for dx, dy in [(0, 0), (0, 1), (1, -1), (1, 0), (1, 1)]:
+            target = (rx + dx)*len(uy) + ry + dy
+            lo = np.searchsorted(sorted_key, target, side='left')
+            hi = np.searchsorted(sorted_key, target, side='right')
+            count = hi - lo
+            i = np.repeat(np.arange(n), count)
+            start = np.repeat(lo - np.cumsum(count) + count, count)
+            j = order[start + np.arange(len(i))]
+            if (dx, dy) == (0, 0):
+                keep = j > i
+                i, j = i[keep], j[keep]
+            first.append(i)
+            second.append(j)
+        i = np.concatenate(first)
+        j = np.concatenate(second)
+        close = np.abs(roots[i] - roots[j]) <= np.maximum(tol[i], tol[j]) + rtol*np.maximum(size[i], size[j])
+        i, j = i[close], j[close]
+    else:
+        # Zero tolerance: only equal roots are grouped
+        _, inverse = np.unique(roots, return_inverse=True)
+        lowest = np.full(n, n)
+        np.minimum.at(lowest, inverse, np.arange(n))
+        i, j = np.arange(n), lowest[inverse]
+
+    # Connected components: every root takes the smallest label among its
+    # neighbours, then labels are followed to their root, until stable
+    labels = np.arange(n)
+    while True:
+        low = np.minimum(labels[i], labels[j])
+        new = labels.copy()
+        np.minimum.at(new, i, low)
+        np.minimum.at(new, j, low)
+        new = new[new]
+        if np.array_equal(new, labels):
+            break
+        labels = new
+
+    # labels[k] is the smallest index in k's group, so groups sorted by
+    # label come out ordered by their first index
+    order = np.argsort(labels, kind='stable')
+    starts = np.nonzero(np.diff(labels[order]))[0] + 1
+    return np.split(order, starts)
+
+def root_spread(c, roots, order=8):
+    # How far rounding errors can scatter the computed copies of a root
+    # of multiplicity m: about (delta(r) / |p^(m)(r)/m!|)^(1/m). The
+    # companion matrix eigenvalues are exact roots of a polynomial whose
+    # coefficients are off by about n*eps*||c||, so delta(r) is that
+    # times 1 + |r| + ... + |r|^(n-1). The smallest value over
+    # m = 1..order is returned for every root; it is tiny for simple roots
+    # and grows like eps^(1/m) for repeated ones.
+    c = np.asarray(c, dtype=complex)
+    z = np.asarray(roots, dtype=complex)
+    n = len(c) - 1
+    backward = n*np.finfo(float).eps*np.linalg.norm(c/c[-1])
+    noise = backward*np.abs(np.polyval(np.ones(n), np.abs(z)))
+    # Taylor coefficients p^(m)(z)/m! by repeated synthetic division
+    q = np.repeat((c/c[-1])[::-1, None], len(z), axis=1)
+    spread = np.full(len(z), np.inf)
+    for m in range(min(order, n) + 1):
+        for i in range(1, len(q)):
+            q[i] = q[i] + q[i-1]*z
+        t = np.abs(q[-1])
+        q = q[:-1]
+        if m > 0:
+            with np.errstate(divide='ignore'):
+                spread = np.minimum(spread, (noise/t)**(1/m))
+    return spread
+
+def refine_roots(c, roots, atol=1e-5, rtol=1e-5, iterations=10):
+    # Clusters approximate roots of c (constant term first) into distinct
+    # roots with multiplicities, then polishes each cluster mean with Newton
+    # on the implicitly deflated polynomial
+    #     p(x) / prod_{j != i} (x - x_j)^m_j,
+    # scaled by the multiplicity m_i so repeated roots converge quadratically.
+    # The clustering tolerance is widened to a few times root_spread(), so
+    # the scattered copies of a multiple root end up in one cluster.
+    # Returns (values, multiplicities).
+    roots = np.asarray(roots, dtype=complex)
+    tol = np.maximum(atol, 4*root_spread(c, roots))
+    groups = cluster_roots(roots, tol, rtol)
+    x = np.array([roots[g].mean() for g in groups], dtype=complex)
+    m = np.array([len(g) for g in groups])
+    p = np.asarray(c, dtype=complex)[::-1]
+    residual = np.abs(np.polyval(p, x))
+    for _ in range(iterations):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            d = x[:, None] - x[None, :]
+            np.fill_diagonal(d, np.inf)
+            deflation = (m[None, :]/d).sum(axis=1)
+            step = m/(1/newton_ratio(c, x) - deflation)
+        step[~np.isfinite(step)] = 0
+        candidate = x - step
+        new_residual = np.abs(np.polyval(p, candidate))
+        # Only keep steps that do not make the residual worse
+        better = (new_residual <= residual) & (step != 0)
+        if not better.any():
+            break
+        x[better] = candidate[better]
+        residual[better] = new_residual[better]
+    return x, m
+
+def root_batch(C):
+    # C is a 2-D array, one polynomial per row, coefficients in the same
+    # order as root() (constant term first). Rows of lower degree are padded
+    # with trailing zeros. Returns a (k, n) complex array where n is the
+    # largest degree; missing roots of lower-degree rows are nan.
+    C = np.atleast_2d(np.asarray(C))
+    k, n = C.shape[0], C.shape[1] - 1
+    nonzero = np.abs(C) >= 1e-14
+    degree = np.where(nonzero.any(axis=1), n - np.argmax(nonzero[:, ::-1], axis=1), 0)
+
+    roots = np.full((k, max(n, 0)), np.nan, dtype=complex)
+    # One stacked eigvals call per distinct degree
+    for d in np.unique(degree):
+        if d == 0:
+            continue
+        rows = np.nonzero(degree == d)[0]
+        c = C[rows, :d+1]
+        companion = np.zeros((len(rows), d, d), dtype=np.result_type(c, float))
+        companion[:, 1:, :-1] = np.eye(d-1)
+        companion[:, :, -1] = -c[:, :-1] / c[:, -1:]
+        roots[rows, :d] = np.linalg.eigvals(companion)
     return roots
 
 if __name__ == "__main__":
     coeffs = [-24, 26, -9, 1]
     print(root(coeffs))
     coeffs = [720, -1764, 1624, -735, 175, -21, 1] 
-    print(root(coeffs))
\ No newline at end of file
+    print(root(coeffs))
+    print(root(coeffs, method='aberth', full_output=True))
+    coeffs = [-8, 12, -6, 1]
+    print(root(coeffs), root(coeffs, polish=True))
+    print(root_batch([[-24, 26, -9, 1],
+                      [-6, 11, -6, 1],
+                      [2, -3, 1, 0]]))
\ No newline at end of file
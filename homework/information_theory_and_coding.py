@@ -1,6 +1,9 @@
+import itertools
 import math
 import random
 
+import numpy as np
+
 def separator(title):
     print(f"\n{'='*20} {title} {'='*20}")
 
@@ -97,6 +100,164 @@ print("Fact: Cross Entropy is minimized when Q = P.")
 # ==========================================
 separator("5. Hamming (7,4) Encode & Decode")
 
+def gf2_rref(M):
+    """Reduced row echelon form of a 0/1 matrix over GF(2) and its pivot columns"""
+    R = np.array(M, dtype=np.uint8) % 2
+    pivots = []
+    row = 0
+    for col in range(R.shape[1]):
+        if row == R.shape[0]:
+            break
+        nonzero = np.nonzero(R[row:, col])[0]
+        if len(nonzero) == 0:
+            continue
+        k = row + nonzero[0]
+        R[[row, k]] = R[[k, row]]
+        # XOR the pivot row into every other row with a 1 in this column
+        mask = R[:, col].copy()
+        mask[row] = 0
+        R ^= np.outer(mask, R[row])
+        pivots.append(col)
+        row += 1
+    return R[:row], pivots
+
+def gf2_null_space(M):
+    """Rows spanning {x : M x = 0} over GF(2)"""
+    R, pivots = gf2_rref(M)
+    n = np.shape(M)[1]
+    free = [c for c in range(n) if c not in pivots]
+    N = np.zeros((len(free), n), dtype=np.uint8)
+    for i, f in enumerate(free):
+        N[i, f] = 1
+        N[i, pivots] = R[:, f]
+    return N
+
+class LinearBlockCode:
+    """
+    Binary (n, k) linear block code: codeword = data @ G (mod 2).
+    G is k x n; H ((n-k) x n, H @ c = 0 for every codeword) is derived
+    from G when not given. Decoding looks the syndrome H @ r up in a table
+    of the lightest error patterns of weight <= t; a nonzero syndrome not
+    in the table is detected but not corrected.
+    Blocks are rows, so encode/decode take (..., k) and (..., n) arrays.
+    """
+    
+    def __init__(self, G, H=None, t=1):
+        self.G = np.array(G, dtype=np.uint8) % 2
+        self.k, self.n = self.G.shape
+        R, pivots = gf2_rref(np.concatenate([self.G, np.eye(self.k, dtype=np.uint8)], axis=1))
+        if pivots[-1] >= self.n:
+            raise ValueError("Generator matrix rows must be linearly independent")
+        # [G | I] ~ [R | A] with A G = R and R = I on the information set:
+        # the data is recovered as codeword[info] @ A.
+        self.info = pivots
+        self.decoder = R[:, self.n:]
+        self.H = gf2_null_space(self.G) if H is None else np.array(H, dtype=np.uint8) % 2
+        if self.H.shape != (self.n - self.k, self.n) or np.any(self.G.astype(int) @ self.H.T.astype(int) % 2):
+            raise ValueError("H must be an (n-k) x n parity check matrix of G")
+        self.t = t
+        self._build_syndrome_table()
+    
+    def _build_syndrome_table(self):
+        r = self.n - self.k
+        self.weights = 1 << np.arange(r)
+        # table[s] is the row of patterns to XOR for syndrome s, -1 if uncorrectable
+        self.table = np.full(1 << r, -1, dtype=np.int64)
+        self.table[0] = 0
+        patterns = [np.zeros(self.n, dtype=np.uint8)]
+        columns = self.syndrome(np.eye(self.n, dtype=np.uint8))
+        for w in range(1, self.t + 1):
+            for positions in itertools.combinations(range(self.n), w):
+                s = np.bitwise_xor.reduce(columns[list(positions)])
+                if self.table[s] < 0:
+                    self.table[s] = len(patterns)
+                    e = np.zeros(self.n, dtype=np.uint8)
+                    e[list(positions)] = 1
+                    patterns.append(e)
+        self.patterns = np.array(patterns)
+        self.pattern_weights = self.patterns.sum(axis=1, dtype=np.int64)
+    
+    @property
+    def rate(self):
+        return self.k / self.n
+    
+    def min_distance(self):
+        """Smallest weight of a nonzero codeword, by enumerating all 2^k codewords"""
+        data = (np.arange(1, 1 << self.k)[:, None] >> np.arange(self.k)) & 1
+        return int(self.encode(data).sum(axis=1).min())
+    
+    def syndrome(self, received):
+        """Syndrome of each block as an int, bit i from row i of H"""
+        s = np.asarray(received).astype(np.int64) @ self.H.T.astype(np.int64) % 2
+        return s @ self.weights
+    
+    def encode(self, data):
+        data = np.asarray(data)
+        if data.shape[-1] != self.k:
+            raise ValueError(f"Data blocks must have {self.k} bits")
+        return (data.astype(np.int64) @ self.G % 2).astype(np.uint8)
+    
+    def decode(self, received):
+        """
+        Returns (data, errors, corrected): errors is the number of corrected
+        bits per block, or -1 where an error was detected but not corrected.
+        """
+        received = np.asarray(received, dtype=np.uint8)
+        if received.shape[-1] != self.n:
+            raise ValueError(f"Code blocks must have {self.n} bits")
+        index = self.table[self.syndrome(received)]
+        correctable = index >= 0
+        corrected = received ^ (self.patterns[np.where(correctable, index, 0)])
+        errors = np.where(correctable, self.pattern_weights[np.maximum(index, 0)], -1)
+        data = (corrected[..., self.info].astype(np.int64) @ self.decoder % 2).astype(np.uint8)
+        return data, errors, corrected
+    
+    def encode_bytes(self, payload):
+        """Bits of an arbitrary-length payload, zero-padded to whole blocks, encoded"""
+        bits = np.unpackbits(np.frombuffer(bytes(payload), dtype=np.uint8))
+        bits = np.concatenate([bits, np.zeros(-len(bits) % self.k, dtype=np.uint8)])
+        return self.encode(bits.reshape(-1, self.k)).ravel()
+    
+    def decode_bytes(self, bits, length):
+        """Inverse of encode_bytes for a payload of length bytes; returns (payload, errors)"""
+        data, errors, _ = self.decode(np.asarray(bits, dtype=np.uint8).reshape(-1, self.n))
+        return np.packbits(data.ravel()[:8 * length]).tobytes(), errors
+
+def hamming_code(r):
+    """
+    Hamming(2^r - 1, 2^r - 1 - r): column j of H is the binary form of
+    position j + 1, so the syndrome of a single error is its 1-based position.
+    Parity bits sit at the power-of-two positions.
+    """
+    n = 2**r - 1
+    positions = np.arange(1, n + 1)
+    H = (positions[None, :] >> np.arange(r)[:, None]) & 1
+    data_positions = [p for p in positions if p & (p - 1)]
+    G = np.zeros((len(data_positions), n), dtype=np.uint8)
+    for i, p in enumerate(data_positions):
+        G[i, p - 1] = 1
+        # parity bit 2^b covers every position with bit b set
+        for b in range(r):
+            if p >> b & 1:
+                G[i, (1 << b) - 1] = 1
+    return LinearBlockCode(G, H)
+
+def extended_hamming_code(r):
+    """
+    SECDED Hamming(2^r, 2^r - 1 - r): a Hamming code plus an overall parity
+    bit. Single errors are corrected, double errors are detected (errors = -1).
+    """
+    base = hamming_code(r)
+    G = np.concatenate([base.G, base.G.sum(axis=1, keepdims=True) % 2], axis=1)
+    H = np.zeros((r + 1, 2**r), dtype=np.uint8)
+    H[:r, :-1] = base.H
+    H[r] = 1
+    return LinearBlockCode(G, H)
+
+BIT_WEIGHTS_7 = 1 << np.arange(6, -1, -1)
+BIT_WEIGHTS_4 = 1 << np.arange(3, -1, -1)
+BULK_CHUNK = 1 << 16  # groups of 4 bytes per NumPy batch in the bulk API
+
 class Hamming74:
     def __init__(self):
         # Generator Matrix G
@@ -118,53 +279,121 @@ class Hamming74:
             [0, 1, 1, 0, 0, 1, 1],
             [0, 0, 0, 1, 1, 1, 1]
         ]
+        
+        # G maps a data column to a codeword column; the general code
+        # works on rows, so it takes the transpose
+        self.code = LinearBlockCode(np.array(self.G).T, self.H)
+        
+        # Lookup tables for the bulk API. A codeword is a 7-bit int with
+        # p1 as the most significant bit, a data nibble has d1 as its MSB.
+        nibbles = (np.arange(16)[:, None] >> np.arange(3, -1, -1)) & 1
+        self.encode_table = self.code.encode(nibbles) @ BIT_WEIGHTS_7
+        words = (np.arange(128)[:, None] >> np.arange(6, -1, -1)) & 1
+        data, _, _ = self.code.decode(words)
+        self.decode_table = (data @ BIT_WEIGHTS_4).astype(np.uint8)
+        self.error_table = self.code.syndrome(words).astype(np.uint8)
+        # Byte-level tables: a byte encodes to two codewords (14 bits).
+        # byte_tables[j] puts them where byte j of a group of 4 lands in
+        # the 56-bit big-endian value of the 7 output bytes (plus one
+        # spare low byte, so the value fills a uint64).
+        b = np.arange(256)
+        pair = (self.encode_table[b >> 4] << 7 | self.encode_table[b & 15]).astype(np.uint64)
+        self.byte_tables = [pair << np.uint64(50 - 14 * j) for j in range(4)]
+        # 14-bit received word -> decoded byte, and 8 * (error position of
+        # the high codeword) + (error position of the low codeword)
+        w = np.arange(1 << 14)
+        self.pair_decode_table = self.decode_table[w >> 7] << 4 | self.decode_table[w & 127]
+        self.pair_error_table = (8 * self.error_table[w >> 7] + self.error_table[w & 127]).astype(np.uint8)
 
     def encode(self, data):
         """Expects a list of 4 bits, e.g., [1, 0, 1, 1]"""
         if len(data) != 4:
             raise ValueError("Data must be 4 bits")
         
-        # d1, d2, d3, d4 = data
-        # p1 = d1 + d2 + d4
-        # p2 = d1 + d3 + d4
-        # p3 = d2 + d3 + d4
-        
-        d1, d2, d3, d4 = data
-        p1 = (d1 + d2 + d4) % 2
-        p2 = (d1 + d3 + d4) % 2
-        p3 = (d2 + d3 + d4) % 2
-        
         # Standard Hamming sequence (p1, p2, d1, p3, d2, d3, d4)
-        return [p1, p2, d1, p3, d2, d3, d4]
+        # p1 = d1 + d2 + d4, p2 = d1 + d3 + d4, p3 = d2 + d3 + d4
+        return self.code.encode(data).tolist()
 
     def decode(self, received):
         """Expects a list of 7 bits"""
-        # Calculate Syndrome
-        # s1 = p1 + d1 + d2 + d4
-        # s2 = p2 + d1 + d3 + d4
-        # s3 = p3 + d2 + d3 + d4
-        
-        r = received # alias
-        # Bit positions (0-indexed): 0  1  2   3  4   5   6
-        # Correspond to:             p1 p2 d1 p3 d2 d3 d4
+        # The columns of H are the positions 1..7 in binary, so the
+        # syndrome s1 * 1 + s2 * 2 + s3 * 4 is the position of a single error
+        syndrome_idx = int(self.code.syndrome(received))
+        decoded_data, _, corrected = self.code.decode(received)
         
-        s1 = (r[0] + r[2] + r[4] + r[6]) % 2
-        s2 = (r[1] + r[2] + r[5] + r[6]) % 2
-        s3 = (r[3] + r[4] + r[5] + r[6]) % 2
-        
-        syndrome_idx = s1 * 1 + s2 * 2 + s3 * 4
-        
-        corrected = list(r)
         error_status = "No Error"
-        
         if syndrome_idx != 0:
             error_status = f"Error at position {syndrome_idx} (1-based)"
-            # Flip the bit at index (syndrome_idx - 1)
-            corrected[syndrome_idx - 1] = 1 - corrected[syndrome_idx - 1]
-            
-        # Extract data bits (indices 2, 4, 5, 6)
-        decoded_data = [corrected[2], corrected[4], corrected[5], corrected[6]]
-        return decoded_data, error_status, corrected
+        
+        return decoded_data.tolist(), error_status, corrected.tolist()
+
+    def _as_bytes(self, data):
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            return np.frombuffer(data, dtype=np.uint8)
+        return np.asarray(data, dtype=np.uint8).ravel()
+
+    def encode_bytes(self, data, chunk=BULK_CHUNK):
+        """
+        Encode a whole buffer (bytes, memoryview or uint8 array), high
+        nibble first, into a packed bit stream: each byte gives two 7-bit
+        codewords (14 bits), so every 4 input bytes fill 7 output bytes.
+        The input is zero-padded to a multiple of 4 bytes.
+        Same bits as np.packbits of the concatenated encode() outputs.
+        """
+        data = self._as_bytes(data)
+        groups = -(-len(data) // 4)
+        out = np.empty((groups, 7), dtype=np.uint8)
+        T0, T1, T2, T3 = self.byte_tables
+        for start in range(0, groups, chunk):
+            block = data[4 * start:4 * (start + chunk)]
+            if len(block) % 4:
+                block = np.concatenate([block, np.zeros(-len(block) % 4, dtype=np.uint8)])
+            block = block.reshape(-1, 4)
+            value = T0[block[:, 0]] | T1[block[:, 1]] | T2[block[:, 2]] | T3[block[:, 3]]
+            out[start:start + len(block)] = value.astype('>u8').view(np.uint8).reshape(-1, 8)[:, :7]
+        return out.ravel()
+
+    def decode_bytes(self, packed, length=None, chunk=BULK_CHUNK):
+        """
+        Decode a stream from encode_bytes, correcting one error per codeword.
+        Returns (data, error_counts): data is a uint8 array of length bytes
+        (default: all of it), error_counts[i] the number of payload codewords
+        with an error at position i (1-based), error_counts[0] the clean ones.
+        length must end in the last group of 4 bytes, as encode_bytes pads it.
+        """
+        packed = self._as_bytes(packed)
+        if len(packed) % 7:
+            raise ValueError("Packed length must be a multiple of 7 bytes")
+        groups = len(packed) // 7
+        if length is None:
+            length = 4 * groups
+        if not 4 * groups - 4 < length <= 4 * groups:
+            raise ValueError(f"Length {length} does not fit {groups} groups of 4 bytes")
+        packed = packed.reshape(groups, 7)
+        out = np.empty((groups, 4), dtype=np.uint8)
+        pairs = np.zeros(64, dtype=np.int64)
+        for start in range(0, groups, chunk):
+            block = packed[start:start + chunk]
+            b0, b1, b2, b3, b4, b5, b6 = (block[:, i].astype(np.uint16) for i in range(7))
+            # the four 14-bit words of the 7 bytes
+            words = (b0 << 6 | b1 >> 2,
+                     (b1 & 3) << 12 | b2 << 4 | b3 >> 4,
+                     (b3 & 15) << 10 | b4 << 2 | b5 >> 6,
+                     (b5 & 63) << 8 | b6)
+            errors = np.empty((len(block), 4), dtype=np.uint8)
+            for j, w in enumerate(words):
+                out[start:start + len(block), j] = self.pair_decode_table[w]
+                errors[:, j] = self.pair_error_table[w]
+            # codewords of the zero padding are not part of the payload
+            padding = errors[-1, length - 4 * (groups - 1):] if start + len(block) == groups else []
+            pairs -= np.bincount(padding, minlength=64)
+            # most words are clean: only count the others
+            errors = errors[errors != 0]
+            pairs += np.bincount(errors, minlength=64)
+            pairs[0] += 4 * len(block) - len(errors)
+        pairs = pairs.reshape(8, 8)
+        counts = pairs.sum(axis=0) + pairs.sum(axis=1)
+        return out.ravel()[:length], counts
 
 # Test Hamming
 hamming = Hamming74()
@@ -181,4 +410,33 @@ print(f"Received (Error): {received_with_error}")
 decoded_data, status, corrected_code = hamming.decode(received_with_error)
 print(f"Decode Status: {status}")
 print(f"Corrected Code: {corrected_code}")
-print(f"Decoded Data: {decoded_data}")
\ No newline at end of file
+print(f"Decoded Data: {decoded_data}")
+
+# Bulk API: a whole buffer at once, two codewords per byte, bit-packed
+message = b"Hamming codes protect bytes in bulk."
+packed = hamming.encode_bytes(message)
+noisy = packed.copy()
+noisy[[0, 9, 20]] ^= np.array([0x40, 0x01, 0x08], dtype=np.uint8)  # one flipped bit in three codewords
+recovered, error_counts = hamming.decode_bytes(noisy, len(message))
+print(f"Bulk: {len(message)} bytes -> {len(packed)} packed bytes")
+print(f"Error counts by position (0 = clean): {error_counts.tolist()}")
+print(f"Recovered: {recovered.tobytes()}")
+
+# ==========================================
+# Task 6: General Linear Block Codes
+# ==========================================
+separator("6. Hamming(15,11) and SECDED Hamming(16,11)")
+
+for code in [hamming_code(3), hamming_code(4), extended_hamming_code(4)]:
+    print(f"(n, k) = ({code.n}, {code.k}), rate = {code.rate:.3f}, d_min = {code.min_distance()}")
+
+secded = extended_hamming_code(4)
+payload = b"Hello, linear block codes!"
+bits = secded.encode_bytes(payload)
+noisy = bits.copy()
+noisy[[5, 40]] ^= 1        # single errors in blocks 0 and 2
+noisy[[70, 75]] ^= 1       # double error in block 4
+recovered, errors = secded.decode_bytes(noisy, len(payload))
+print(f"Payload: {len(payload)} bytes -> {len(bits)} code bits in {len(errors)} blocks")
+print(f"Errors per block (-1 = detected, uncorrectable): {errors.tolist()}")
+print(f"Recovered: {recovered}  (block 4 is flagged, its two errors are not corrected)")